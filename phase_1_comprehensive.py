@@ -22,7 +22,16 @@ Booleans: Light switches (only ON or OFF).
 Operators (The Action Verbs):
 
 These are the actions that happen on stage. + combines things, == compares them, and connects conditions."""
+
+# Printable name of each primitive type (e.g. "<class 'int'>"), built once at
+# import time so printing a type is a dictionary lookup, not a new string.
+_TYPESTR = {t: str(t) for t in (int, float, complex, bool, type(None))}
+
 def main():
+    # Output note: each section collects its lines in a list and prints them
+    # with ONE print() call. Every print() is a separate write to the console,
+    # so batching the text is cheaper than many small prints.
+
     # ==========================================
     # 1. BASIC SYNTAX
     # ==========================================
@@ -36,7 +45,7 @@ def main():
     # ==========================================
     # 2. VARIABLES & PRIMITIVE TYPES
     # ==========================================
-    print("\n--- 2. Variables & Primitives ---")
+    lines = ["\n--- 2. Variables & Primitives ---"]
     # Dynamic Typing: No need to declare type.
     # Naming Convention: snake_case for variables.
     
@@ -46,60 +55,66 @@ def main():
     my_boolean = True            # bool
     my_none = None               # NoneType (absence of value)
 
-    print(f"Integer: {my_integer}, Type: {type(my_integer)}")
-    print(f"Float: {my_float}, Type: {type(my_float)}")
-    print(f"Boolean: {my_boolean}, Type: {type(my_boolean)}")
+    lines.append(f"Integer: {my_integer}, Type: {_TYPESTR[type(my_integer)]}")
+    lines.append(f"Float: {my_float}, Type: {_TYPESTR[type(my_float)]}")
+    lines.append(f"Boolean: {my_boolean}, Type: {_TYPESTR[type(my_boolean)]}")
+    print("\n".join(lines))
 
     # ==========================================
     # 3. STRINGS & FORMATTING
     # ==========================================
-    print("\n--- 3. Strings & Formatting ---")
+    lines = ["\n--- 3. Strings & Formatting ---"]
     first_name = "Gemini"
     language = "Python"
     
     # f-strings (Preferred, Python 3.6+)
-    print(f"Hello, I am {first_name} and I speak {language}.")
+    lines.append(f"Hello, I am {first_name} and I speak {language}.")
     
     # .format() method
-    print("I am {} and I speak {}.".format(first_name, language))
+    lines.append("I am {} and I speak {}.".format(first_name, language))
     
     # % operator (Legacy)
-    print("I am %s and I speak %s." % (first_name, language))
+    lines.append("I am %s and I speak %s." % (first_name, language))
+    print("\n".join(lines))
 
     # ==========================================
     # 4. TYPE CASTING
     # ==========================================
-    print("\n--- 4. Type Casting ---")
+    lines = ["\n--- 4. Type Casting ---"]
     # Implicit: Python automatically converts smaller types to larger types (int -> float)
     result = my_integer + my_float 
-    print(f"Implicit (int + float): {result} is {type(result)}")
+    lines.append(f"Implicit (int + float): {result} is {_TYPESTR[type(result)]}")
 
     # Explicit: Manually converting types
     str_num = "100"
     converted_int = int(str_num)
-    print(f"Explicit (str -> int): '{str_num}' becomes {converted_int}")
+    lines.append(f"Explicit (str -> int): '{str_num}' becomes {converted_int}")
+    print("\n".join(lines))
 
     # ==========================================
     # 5. OPERATORS
     # ==========================================
-    print("\n--- 5. Operators ---")
+    lines = ["\n--- 5. Operators ---"]
     a, b = 10, 3
 
     # Arithmetic
-    print(f"Division ({a}/{b}): {a/b}")       # 3.333...
-    print(f"Floor Div ({a}//{b}): {a//b}")    # 3
-    print(f"Modulus ({a}%{b}): {a%b}")        # 1
-    print(f"Power ({a}**{b}): {a**b}")        # 1000
+    lines.append(f"Division ({a}/{b}): {a/b}")       # 3.333...
+    lines.append(f"Floor Div ({a}//{b}): {a//b}")    # 3
+    lines.append(f"Modulus ({a}%{b}): {a%b}")        # 1
+    lines.append(f"Power ({a}**{b}): {a**b}")        # 1000
+    # For a small, FIXED exponent, plain multiplication skips the general power algorithm.
+    lines.append(f"Cube ({a}*{a}*{a}): {a*a*a}")      # 1000
 
     # Comparison & Logical
-    print(f"Is {a} > {b}? {a > b}")
-    print(f"Logic: {True and False}")
+    lines.append(f"Is {a} > {b}? {a > b}")
+    lines.append(f"Logic: {True and False}")
 
     # Identity (is) vs Equality (==)
     list_1 = [1, 2, 3]
     list_2 = [1, 2, 3]
-    print(f"Values equal? (==): {list_1 == list_2}") # True
-    print(f"Same object? (is): {list_1 is list_2}")  # False (different memory locations)
+    lines.append(f"Values equal? (==): {list_1 == list_2}") # True
+    lines.append(f"Same object? (is): {list_1 is list_2}")  # False (different memory locations)
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -31,6 +31,17 @@ Imagine a toy box with holes for shapes. You hold an object (variable).
 Does it fit in the square hole? No.
 The triangle hole? Yes -> Drop it in (execute code).
 It's cleaner than checking 10 different if statements."""
+
+# Lookup table for the pattern-matching section. Built once at import time;
+# 400 and 404 share one message, just like 'case 400 | 404' below.
+_CLIENT_ERROR = "Client Error (400 or 404)"
+_STATUS = {
+    200: "Success (200)",
+    400: _CLIENT_ERROR,
+    404: _CLIENT_ERROR,
+    500: "Server Error (500)",
+}
+
 def main():
     # ==========================================
     # 1. CONDITIONAL STATEMENTS (The Fork in the Road)
@@ -73,6 +84,14 @@ def main():
         battery -= 1
     print("  System Shutdown")
 
+    # D. LOOP-INVARIANT WORK
+    # If a value doesn't change while the loop runs (like the length of a list
+    # the loop never modifies), compute it ONCE before the loop and reuse it.
+    print("Hoisted len():")
+    fruit_count = len(fruits)  # Computed once, not on every pass
+    for position, fruit in enumerate(fruits, start=1):
+        print(f"  {fruit} ({position} of {fruit_count})")
+
     # ==========================================
     # 3. CONTROL KEYWORDS
     # ==========================================
@@ -123,5 +142,10 @@ def main():
         case _:          # Wildcard (matches anything else)
             print("Unknown Status")
 
+    # When every case just maps a fixed value to a result, a dictionary does
+    # the same job with a single lookup instead of testing case after case.
+    # .get() supplies the default, playing the role of 'case _'.
+    print(f"Lookup table: {_STATUS.get(status_code, 'Unknown Status')}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
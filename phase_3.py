@@ -43,6 +43,10 @@ def main():
     shopping_list[1] = "butter"     # Change an item
     removed_item = shopping_list.pop() # Remove the last item
     shopping_list.sort()            # Sorts the list in-place
+    # For a handful of items, list.sort() is the right tool. For very large
+    # lists of one type (e.g. millions of numbers), a typed array such as
+    # numpy.sort() keeps the data packed together and sorts it much faster.
+    # Below roughly a hundred items, numpy's setup cost outweighs the gain.
     
     print(f"Modified list: {shopping_list}")
     print(f"Removed item: {removed_item}")
@@ -97,8 +101,10 @@ def main():
     friend_fruits = {"banana", "orange", "mango"}
     
     # Set Operations
-    all_fruits = my_fruits.union(friend_fruits)
-    common_fruits = my_fruits.intersection(friend_fruits)
+    # '|' and '&' are the operator forms of .union() and .intersection().
+    # They skip the method lookup; use the methods when the other side is not a set.
+    all_fruits = my_fruits | friend_fruits
+    common_fruits = my_fruits & friend_fruits
     
     print(f"My fruits: {my_fruits}")
     print(f"Combined fruits (union): {all_fruits}")
@@ -127,12 +133,20 @@ def main():
     print("\n--- 6. Comprehensions ---")
     
     # List comprehension: [expression for item in iterable if condition]
-    squares = [x**2 for x in range(10) if x % 2 == 0]
+    # e.g. [x**2 for x in range(10) if x % 2 == 0]
+    # When the condition just picks every 2nd number, a range step does the
+    # same job without visiting (and testing) the odd numbers at all.
+    squares = [x * x for x in range(0, 10, 2)]
     print(f"Squares of even numbers: {squares}")
     
     # Dictionary comprehension
-    square_dict = {x: x**2 for x in range(5)}
+    square_dict = {x: x * x for x in range(5)}
     print(f"Dictionary of squares: {square_dict}")
 
+    # When the keys are just 0, 1, 2, ... a tuple does the same job without a
+    # hash table: the position IS the key, so square_tuple[3] works like square_dict[3].
+    square_tuple = tuple(x * x for x in range(5))
+    print(f"Tuple of squares: {square_tuple} (square_tuple[3] = {square_tuple[3]})")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -40,7 +40,11 @@ Package (directory): The entire cabinet or section of the kitchen (e.g., a bakin
 import math
 
 # You can import a specific function and give it an alias.
-from math import factorial as fact
+from functools import cache as memoize
+
+# 'fact' is math.factorial wrapped in a cache: repeat calls with the same
+# argument become a dictionary lookup instead of recomputing the product.
+fact = memoize(math.factorial)
 
 # A package is a directory of modules. It must contain an __init__.py file.
 # Example structure you would create on your file system:
@@ -50,6 +54,75 @@ from math import factorial as fact
 #
 # You would then use it like this:
 # from my_package import string_utils
+#
+# Lazy imports: an 'import' statement can also live inside a function. The
+# module is then loaded the first time the function runs, and later imports
+# just fetch it from the sys.modules cache. This is worth it only for heavy
+# modules that are rarely needed. Cheap imports like 'math' belong at the
+# top of the file (PEP 8).
+
+
+# ==========================================
+# FUNCTIONS USED BY main()
+# ==========================================
+# Defined at module level so each 'def' runs once, at import time,
+# instead of rebuilding the function objects on every call to main().
+
+# 1. & 2. DEFINING FUNCTIONS & PARAMETERS
+# Mental Model: A specialized appliance with settings.
+def make_greeting(name, greeting="Hello", punctuation="!"):
+    """Creates a greeting string. Demonstrates all parameter types."""
+    return f"{greeting}, {name}{punctuation}"
+
+
+# 3. VARIABLE LENGTH ARGUMENTS (*args, **kwargs)
+# Mental Model: A "catch-all" bin for extra ingredients/settings.
+def kitchen_sink_blender(main_ingredient, *extra_ingredients, **settings):
+    """Blends ingredients with various settings."""
+    print(f"Main ingredient: {main_ingredient}")
+
+    if extra_ingredients:
+        # *args is a tuple of extra positional arguments
+        print(f"Extra ingredients (*args): {extra_ingredients}")
+
+    if settings:
+        # **kwargs is a dictionary of extra keyword arguments
+        print("Settings (**kwargs):")
+        for key, value in settings.items():
+            print(f"  - {key}: {value}")
+
+
+# 4. SCOPE (Local, Global, Nonlocal)
+pantry_item = "Sugar"  # Global scope
+
+def outer_function():
+    counter_item = "Flour"  # Enclosing scope
+
+    def inner_function():
+        local_item = "Eggs"  # Local scope
+
+        global pantry_item
+        pantry_item = "Brown Sugar"  # Modify the global variable
+
+        nonlocal counter_item
+        counter_item = "Whole Wheat Flour"  # Modify the enclosing variable
+
+        print(f"  Inner sees: {local_item}, {counter_item}, and {pantry_item}")
+
+    print(f"Before inner call, outer sees: {counter_item}")
+    inner_function()
+    print(f"After inner call, outer sees: {counter_item} (modified by inner)")
+
+
+# 6. RECURSION
+# Mental Model: Russian nesting dolls.
+def countdown(n):
+    """Counts down from n to 1, then prints 'Blastoff!'."""
+    if n <= 0:
+        print("Blastoff!")  # Base case: The condition to stop.
+        return
+    print(n)
+    countdown(n - 1)  # Recursive step: Call self with a smaller problem.
 
 
 def main():
@@ -57,10 +130,7 @@ def main():
     # 1. & 2. DEFINING FUNCTIONS & PARAMETERS
     # ==========================================
     print("--- 1. & 2. Functions & Parameters ---")
-    # Mental Model: A specialized appliance with settings.
-    def make_greeting(name, greeting="Hello", punctuation="!"):
-        """Creates a greeting string. Demonstrates all parameter types."""
-        return f"{greeting}, {name}{punctuation}"
+    # 'make_greeting' is defined above main().
 
     # Calling with positional arguments
     print(f"Positional: {make_greeting('World')}")
@@ -75,47 +145,14 @@ def main():
     # 3. VARIABLE LENGTH ARGUMENTS (*args, **kwargs)
     # ==========================================
     print("\n--- 3. Variable Length Arguments ---")
-    # Mental Model: A "catch-all" bin for extra ingredients/settings.
-    def kitchen_sink_blender(main_ingredient, *extra_ingredients, **settings):
-        """Blends ingredients with various settings."""
-        print(f"Main ingredient: {main_ingredient}")
-
-        if extra_ingredients:
-            # *args is a tuple of extra positional arguments
-            print(f"Extra ingredients (*args): {extra_ingredients}")
-
-        if settings:
-            # **kwargs is a dictionary of extra keyword arguments
-            print("Settings (**kwargs):")
-            for key, value in settings.items():
-                print(f"  - {key}: {value}")
-
     kitchen_sink_blender("Banana", "Strawberry", "Spinach", speed="High", pulse=True)
 
     # ==========================================
     # 4. SCOPE (Local, Global, Nonlocal)
     # ==========================================
     print("\n--- 4. Scope ---")
-    pantry_item = "Sugar"  # Global scope
-
-    def outer_function():
-        counter_item = "Flour"  # Enclosing scope
-
-        def inner_function():
-            local_item = "Eggs"  # Local scope
-
-            global pantry_item
-            pantry_item = "Brown Sugar"  # Modify the global variable
-
-            nonlocal counter_item
-            counter_item = "Whole Wheat Flour"  # Modify the enclosing variable
-
-            print(f"  Inner sees: {local_item}, {counter_item}, and {pantry_item}")
-
-        print(f"Before inner call, outer sees: {counter_item}")
-        inner_function()
-        print(f"After inner call, outer sees: {counter_item} (modified by inner)")
-
+    # 'pantry_item' is a real module-level global, so the 'global' statement
+    # inside inner_function changes the value printed here.
     print(f"Before outer call, global pantry has: '{pantry_item}'")
     outer_function()
     print(f"After outer call, global pantry has: '{pantry_item}'")
@@ -139,14 +176,6 @@ def main():
     # 6. RECURSION
     # ==========================================
     print("\n--- 6. Recursion ---")
-    # Mental Model: Russian nesting dolls.
-    def countdown(n):
-        if n <= 0:
-            print("Blastoff!")  # Base case: The condition to stop.
-            return
-        print(n)
-        countdown(n - 1)  # Recursive step: Call self with a smaller problem.
-
     countdown(3)
 
     # ==========================================
@@ -28,7 +28,146 @@ You have a button labeled "Play". If you point it at a DVD player, it spins a di
 Magic Methods (The Wizardry):
 
 Python objects are born knowing nothing. They don't know how to add themselves (+) or print themselves as text. Magic methods (like __add__ or __str__) teach them these fundamental skills."""
+import math
 from abc import ABC, abstractmethod
+from operator import add
+
+# ==========================================
+# CLASSES USED BY main()
+# ==========================================
+# Defined at module level so each class body runs once, at import time,
+# instead of rebuilding the classes on every call to main().
+
+# 1. CLASSES & OBJECTS (The Blueprint & The House)
+class Dog:
+    # Class Variable: Shared by ALL instances of this class
+    species = "Canis familiaris"
+
+    # __slots__: Fixed instance attributes, no per-instance __dict__ (saves memory)
+    __slots__ = ('name', 'age')
+
+    # The Constructor: Initializes the object
+    def __init__(self, name, age):
+        # Instance Variables: Unique to EACH instance
+        self.name = name
+        self.age = age
+
+    # Instance Method: Actions the object can perform
+    def bark(self):
+        return f"{self.name} says Woof!"
+
+
+# 2. INHERITANCE & POLYMORPHISM (Genetics & Overriding)
+# Single Inheritance: Cat inherits from Dog (just for example purposes!)
+class Cat(Dog):
+    __slots__ = ()  # No new attributes; keeps instances __dict__-free like Dog
+
+    # Polymorphism: Method Overriding (Changing inherited behavior)
+    def bark(self):
+        return f"{self.name} says Meow!"
+
+
+# 3. ENCAPSULATION (Public, Protected, Private)
+class BankAccount:
+    __slots__ = ('owner', '_type', '__balance')  # '__balance' is name-mangled too
+
+    def __init__(self, owner, balance):
+        self.owner = owner       # Public: Accessible from anywhere
+        self._type = "Savings"   # Protected: Convention (don't touch outside class)
+        # Private: Harder to access outside class.
+        # Money is stored as whole cents (int) so adding never picks up float rounding errors.
+        self.__balance = round(balance * 100)
+
+    def deposit(self, amount):
+        if amount > 0:
+            self.__balance += round(amount * 100)
+            print(f"Deposited ${amount}")
+
+    # Getter method to access private variable safely
+    def get_balance(self):
+        return self.__balance / 100
+
+
+# 4. ABSTRACTION (The Dashboard)
+# Abstract Base Class: Cannot be instantiated, only inherited from
+class Shape(ABC):
+    @abstractmethod
+    def area(self):
+        pass
+
+
+class Circle(Shape):
+    def __init__(self, radius):
+        self.radius = radius
+
+    def area(self):
+        return math.pi * self.radius * self.radius
+
+    # For many circles at once, work on a plain list of radii instead of
+    # building a Circle object for each one.
+    @classmethod
+    def areas(cls, radii):
+        """Returns the area for every radius in 'radii'."""
+        pi = math.pi
+        return [pi * r * r for r in radii]
+
+
+# 5. DECORATORS (@classmethod, @staticmethod, @property)
+class Temperature:
+    __slots__ = ('_celsius',)
+
+    # Conversion constants: Class Variables, computed once instead of on every access
+    _C2F_SCALE = 1.8          # 9/5
+    _F2C_SCALE = 5.0 / 9.0
+    _C2F_OFFSET = 32.0
+
+    def __init__(self, celsius):
+        self._celsius = celsius
+
+    # @property: Access a method like an attribute (getter)
+    @property
+    def fahrenheit(self):
+        return self._celsius * Temperature._C2F_SCALE + Temperature._C2F_OFFSET
+
+    # Setter for the property
+    @fahrenheit.setter
+    def fahrenheit(self, value):
+        self._celsius = (value - Temperature._C2F_OFFSET) * Temperature._F2C_SCALE
+
+    # @classmethod: Works with the class, not the instance (Factory method)
+    @classmethod
+    def from_kelvin(cls, kelvin):
+        return cls(kelvin - 273.15)
+
+    # @staticmethod: Utility function, doesn't need self or cls
+    @staticmethod
+    def is_hot(celsius):
+        return celsius > 30
+
+
+# 6. MAGIC METHODS (Dunder Methods)
+class Vector:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    # __str__: Defines how the object looks as a string
+    def __str__(self):
+        return f"Vector({self.x}, {self.y})"
+
+    # __add__: Defines behavior for the '+' operator
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    # Adding many vectors one '+' at a time creates a new Vector per pair.
+    # For bulk work, keep the x's and y's in separate lists and add them
+    # column by column: map(add, ...) runs the loop in C.
+    @classmethod
+    def batch_add(cls, ax, ay, bx, by):
+        """Adds vectors stored as coordinate lists; returns (xs, ys)."""
+        return list(map(add, ax, bx)), list(map(add, ay, by))
 
 def main():
     # ==========================================
@@ -36,20 +175,6 @@ def main():
     # ==========================================
     print("--- 1. Classes & Objects ---")
     
-    class Dog:
-        # Class Variable: Shared by ALL instances of this class
-        species = "Canis familiaris"
-
-        # The Constructor: Initializes the object
-        def __init__(self, name, age):
-            # Instance Variables: Unique to EACH instance
-            self.name = name
-            self.age = age
-
-        # Instance Method: Actions the object can perform
-        def bark(self):
-            return f"{self.name} says Woof!"
-
     # Instantiation: Creating objects from the class
     dog1 = Dog("Buddy", 3)
     dog2 = Dog("Rex", 5)
@@ -63,12 +188,6 @@ def main():
     # ==========================================
     print("\n--- 2. Inheritance & Polymorphism ---")
     
-    # Single Inheritance: Cat inherits from Dog (just for example purposes!)
-    class Cat(Dog):
-        # Polymorphism: Method Overriding (Changing inherited behavior)
-        def bark(self):
-            return f"{self.name} says Meow!"
-
     cat = Cat("Whiskers", 2)
     # Inherits 'species' and '__init__' from Dog, but uses its own 'bark'
     print(f"{cat.name} (Species: {cat.species})") 
@@ -79,77 +198,26 @@ def main():
     # ==========================================
     print("\n--- 3. Encapsulation ---")
     
-    class BankAccount:
-        def __init__(self, owner, balance):
-            self.owner = owner       # Public: Accessible from anywhere
-            self._type = "Savings"   # Protected: Convention (don't touch outside class)
-            self.__balance = balance # Private: Harder to access outside class
-
-        def deposit(self, amount):
-            if amount > 0:
-                self.__balance += amount
-                print(f"Deposited ${amount}")
-
-        # Getter method to access private variable safely
-        def get_balance(self):
-            return self.__balance
-
     account = BankAccount("Alice", 1000)
     account.deposit(500)
     # print(account.__balance) # This would raise an AttributeError
-    print(f"Balance: ${account.get_balance()}")
+    print(f"Balance: ${account.get_balance():.2f}")
 
     # ==========================================
     # 4. ABSTRACTION (The Dashboard)
     # ==========================================
     print("\n--- 4. Abstraction ---")
     
-    # Abstract Base Class: Cannot be instantiated, only inherited from
-    class Shape(ABC):
-        @abstractmethod
-        def area(self):
-            pass
-
-    class Circle(Shape):
-        def __init__(self, radius):
-            self.radius = radius
-
-        def area(self):
-            return 3.14 * self.radius ** 2
-
     # shape = Shape() # Error: Cannot instantiate abstract class
     circle = Circle(5)
     print(f"Circle Area: {circle.area()}")
+    print(f"Areas for radii 1, 2, 3: {Circle.areas([1, 2, 3])}")
 
     # ==========================================
     # 5. DECORATORS (@classmethod, @staticmethod, @property)
     # ==========================================
     print("\n--- 5. Method Decorators & Properties ---")
 
-    class Temperature:
-        def __init__(self, celsius):
-            self._celsius = celsius
-
-        # @property: Access a method like an attribute (getter)
-        @property
-        def fahrenheit(self):
-            return (self._celsius * 9/5) + 32
-
-        # Setter for the property
-        @fahrenheit.setter
-        def fahrenheit(self, value):
-            self._celsius = (value - 32) * 5/9
-
-        # @classmethod: Works with the class, not the instance (Factory method)
-        @classmethod
-        def from_kelvin(cls, kelvin):
-            return cls(kelvin - 273.15)
-
-        # @staticmethod: Utility function, doesn't need self or cls
-        @staticmethod
-        def is_hot(celsius):
-            return celsius > 30
-
     temp = Temperature(25)
     print(f"25C is {temp.fahrenheit}F (Calculated via property)")
     
@@ -161,23 +229,13 @@ def main():
     # ==========================================
     print("\n--- 6. Magic Methods ---")
     
-    class Vector:
-        def __init__(self, x, y):
-            self.x = x
-            self.y = y
-
-        # __str__: Defines how the object looks as a string
-        def __str__(self):
-            return f"Vector({self.x}, {self.y})"
-
-        # __add__: Defines behavior for the '+' operator
-        def __add__(self, other):
-            return Vector(self.x + other.x, self.y + other.y)
-
     v1 = Vector(2, 4)
     v2 = Vector(1, 3)
     v3 = v1 + v2
     print(f"{v1} + {v2} = {v3}")
 
+    xs, ys = Vector.batch_add([2, 5], [4, 6], [1, 1], [3, 2])
+    print(f"Batch add (x's, y's): {xs}, {ys}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
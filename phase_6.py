@@ -28,6 +28,22 @@ If you manually open() a file, you might forget to close() it (return the book).
 The with statement is an automatic librarian. It hands you the book, and the moment you step away from the desk (exit the code block)—even if you faint (error)—the librarian immediately snatches the book back and checks it in (close())."""
 
 import os
+import shutil
+import sys
+from pathlib import Path
+
+# ==========================================
+# CLASSES USED BY main()
+# ==========================================
+# Defined at module level so each class body runs once, at import time,
+# instead of rebuilding the classes on every call to main().
+
+# 2. RAISING & CUSTOM EXCEPTIONS (The Fire Alarm)
+# Custom Exception: Creating a specific label for a specific problem.
+# Inheriting from Exception class
+class CoffeeTooHotError(Exception):
+    """Raised when the coffee temperature is too high."""
+    pass
 
 def main():
     # ==========================================
@@ -46,13 +62,17 @@ def main():
 
     try:
         number = int(user_input)
-        result = 10 / number
     except ValueError:
         print("  Error: That's not a valid number!")
-    except ZeroDivisionError:
-        print("  Error: You cannot divide by zero!")
     else:
-        print(f"  Success! Result is {result}")
+        # Look Before You Leap (LBYL): a zero divisor is an expected input, not a
+        # surprise, so check for it instead of letting 10 / 0 raise ZeroDivisionError.
+        # Raising and catching an exception is far slower than an 'if' when it
+        # happens often (e.g. inside a loop).
+        if number == 0:
+            print("  Error: You cannot divide by zero!")
+        else:
+            print(f"  Success! Result is {10 / number}")
     finally:
         print("  (Cleanup: Execution complete)")
 
@@ -61,12 +81,6 @@ def main():
     # ==========================================
     print("\n--- 2. Raising & Custom Exceptions ---")
 
-    # Custom Exception: Creating a specific label for a specific problem.
-    # Inheriting from Exception class
-    class CoffeeTooHotError(Exception):
-        """Raised when the coffee temperature is too high."""
-        pass
-
     def drink_coffee(temp):
         if temp > 85:
             # Raising: Pulling the alarm manually.
@@ -85,32 +99,47 @@ def main():
     
     filename = "example_phase_6.txt"
 
-    # Writing to a file using 'with' (Context Manager)
-    # Mental Model: The 'with' keyword is an automatic librarian.
-    # It hands you the file, and automatically closes it when you leave the block.
+    path = Path(filename)
+
+    # Writing a whole file in one go
+    # Path.write_text() opens the file in mode 'w' (Overwrites existing content),
+    # writes the string in ONE call and closes it again.
     print(f"Writing to '{filename}'...")
-    
-    # Mode 'w': Write (Overwrites existing content)
-    with open(filename, "w") as file:
-        file.write("Hello, File World!\n")
-        file.write("This file was created by Python.")
+    path.write_text("Hello, File World!\n"
+                    "This file was created by Python.")
 
-    # Reading from a file
+    # Reading a file straight to the screen
     # Mode 'r': Read (Default)
+    # shutil.copyfileobj() copies the text to stdout in chunks, so the file is
+    # never held in memory as one big string.
     print(f"Reading from '{filename}':")
     try:
-        with open(filename, "r") as file:
-            content = file.read()
-            print(f"---\n{content}\n---")
+        with path.open("r") as file:
+            print("---")
+            shutil.copyfileobj(file, sys.stdout)
+            print("\n---")
     except FileNotFoundError:
         print("  Error: File not found!")
 
-    # Appending to a file
+    # Appending to a file using 'with' (Context Manager)
+    # Mental Model: The 'with' keyword is an automatic librarian.
+    # It hands you the file, and automatically closes it when you leave the block.
     # Mode 'a': Append (Adds to the end)
     print("Appending a new line...")
-    with open(filename, "a") as file:
+    # buffering: the size of the in-memory buffer. A larger one (64 KiB vs the
+    # default 8 KiB) means fewer trips to the OS for big writes; small random
+    # reads on seekable files may prefer the smaller default.
+    with path.open("a", buffering=64 * 1024) as file:
         file.write("\nThis line was appended.")
 
+    # Reading line by line
+    # Looping over the file object reads one line at a time, so only the current
+    # line is in memory. Prefer this to file.read()/readlines() for big files.
+    print("Reading line by line:")
+    with path.open("r") as file:
+        for line_number, line in enumerate(file, start=1):
+            print(f"  {line_number}: {line.rstrip()}")
+
     # Cleanup (deleting the file to keep your folder clean)
     if os.path.exists(filename):
         os.remove(filename)
@@ -32,20 +32,31 @@ Normal objects use a dictionary (__dict__) to store attributes. It's flexible (y
 __slots__ is a fixed menu. You can only have exactly what is listed. It saves massive amounts of memory if you have millions of objects."""
 import sys
 import time
-import threading
 import multiprocessing
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
+# ==========================================
+# DATA USED BY main()
+# ==========================================
+# 1. MEMORY MANAGEMENT: built once at import instead of on every main() call.
+_DEMO_LIST = [1, 2, 3]
+
 # ==========================================
 # HELPER FUNCTIONS FOR CONCURRENCY
 # ==========================================
 def cpu_bound_task(n):
     """A task that requires heavy calculation (for Multiprocessing)."""
-    count = 0
-    for i in range(n):
-        count += i
-    return count
+    # sum() over a range runs its loop in C, instead of a Python 'for' + '+='.
+    return sum(range(n))
+
+def cpu_bound_task_closed(n):
+    """Same result as cpu_bound_task, via the formula 0 + 1 + ... + (n-1) = n*(n-1)/2.
+
+    A better algorithm beats any amount of parallel hardware: O(1) instead of O(n).
+    """
+    return n * (n - 1) // 2
 
 def io_bound_task(name, duration):
     """A task that waits (for Threading)."""
@@ -60,6 +71,72 @@ async def async_task(name, duration):
     print(f"  Async {name}: finished!")
 
 
+# ==========================================
+# CLASSES USED BY main()
+# ==========================================
+# Defined at module level so each class body runs once, at import time,
+# instead of rebuilding the classes on every call to main().
+
+# 2. METAPROGRAMMING (Metaclasses)
+# A metaclass that forces all class attribute names to be uppercase.
+class UpperCaseMeta(type):
+    def __new__(cls, name, bases, attrs):
+        # Dunder names (e.g. __module__) are kept as-is; everything else is uppercased.
+        uppercase_attrs = {
+            (key if key[:2] == "__" else key.upper()): value
+            for key, value in attrs.items()
+        }
+        return super().__new__(cls, name, bases, uppercase_attrs)
+
+
+class MyClass(metaclass=UpperCaseMeta):
+    hello = "world"
+
+
+# 3. DESCRIPTORS
+class PositiveNumber:
+    """A descriptor that enforces positive values."""
+    __slots__ = ('name', 'private_name')
+
+    # __set_name__: Called when the owner class is created, so the descriptor
+    # learns its attribute name ('balance') without it being passed in.
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.private_name = "_" + name  # Where the real value is stored
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self  # Accessed on the class itself
+        return getattr(instance, self.private_name)
+
+    def __set__(self, instance, value):
+        if value < 0:
+            raise ValueError(f"{self.name} cannot be negative!")
+        setattr(instance, self.private_name, value)
+        print(f"  Set {self.name} to {value}")
+
+
+class BankAccount:
+    __slots__ = ('_balance',)  # Storage slot used by the descriptor
+    balance = PositiveNumber()
+
+    def __init__(self, init_balance):
+        self.balance = init_balance
+
+
+# 6. SLOTS (Memory Optimization)
+class RegularPoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class SlottedPoint:
+    __slots__ = ['x', 'y'] # Fixed attributes, no __dict__
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
 def main():
     # ==========================================
     # 1. MEMORY MANAGEMENT
@@ -67,13 +144,14 @@ def main():
     print("--- 1. Memory Management ---")
     
     # id(): The memory address
-    x = [1, 2, 3]
+    x = _DEMO_LIST
     y = x
     print(f"ID of x: {id(x)}")
     print(f"ID of y: {id(y)} (Same as x)")
     
     # Reference Counting
     # Note: getrefcount returns 1 higher than expected because passing it to the function adds a ref.
+    # The module-level name _DEMO_LIST also holds a reference to the same list.
     print(f"Ref count of x: {sys.getrefcount(x)}") 
     del y
     print(f"Ref count after deleting y: {sys.getrefcount(x)}")
@@ -83,20 +161,6 @@ def main():
     # ==========================================
     print("\n--- 2. Metaprogramming ---")
     
-    # A metaclass that forces all class attribute names to be uppercase.
-    class UpperCaseMeta(type):
-        def __new__(cls, name, bases, attrs):
-            uppercase_attrs = {}
-            for key, value in attrs.items():
-                if not key.startswith("__"):
-                    uppercase_attrs[key.upper()] = value
-                else:
-                    uppercase_attrs[key] = value
-            return super().__new__(cls, name, bases, uppercase_attrs)
-
-    class MyClass(metaclass=UpperCaseMeta):
-        hello = "world"
-
     # print(MyClass.hello) # This would fail!
     print(f"Modified attribute: MyClass.HELLO = {MyClass.HELLO}")
 
@@ -105,26 +169,6 @@ def main():
     # ==========================================
     print("\n--- 3. Descriptors ---")
     
-    class PositiveNumber:
-        """A descriptor that enforces positive values."""
-        def __init__(self, name):
-            self.name = name
-
-        def __get__(self, instance, owner):
-            return instance.__dict__.get(self.name)
-
-        def __set__(self, instance, value):
-            if value < 0:
-                raise ValueError(f"{self.name} cannot be negative!")
-            instance.__dict__[self.name] = value
-            print(f"  Set {self.name} to {value}")
-
-    class BankAccount:
-        balance = PositiveNumber("balance")
-
-        def __init__(self, init_balance):
-            self.balance = init_balance
-
     acc = BankAccount(100)
     try:
         acc.balance = -50
@@ -138,28 +182,34 @@ def main():
 
     # A. Threading (I/O Bound)
     print("A. Threading:")
-    t1 = threading.Thread(target=io_bound_task, args=("A", 1))
-    t2 = threading.Thread(target=io_bound_task, args=("B", 1))
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
+    # A pool of worker threads reused for every task submitted to it, instead of
+    # starting a brand-new thread per task. Its workers are ordinary threading.Thread
+    # objects. Leaving the 'with' block shuts the pool down and joins its threads,
+    # so no threads are left running when the multiprocessing demo below forks.
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        futures = [io_pool.submit(io_bound_task, name, 1) for name in ("A", "B")]
+        for future in futures:
+            future.result()  # Wait for the task (re-raises any error it hit)
 
     # B. Multiprocessing (CPU Bound)
-    # Note: In a real script, this often needs 'if __name__ == "__main__":' protection
+    # A Pool starts its worker processes once (one per CPU core by default) and
+    # hands them task after task, instead of paying process start-up per job.
+    # Note: This needs 'if __name__ == "__main__":' protection (see the bottom
+    # of this file), because on some platforms each worker re-imports this module.
     print("B. Multiprocessing:")
-    p1 = multiprocessing.Process(target=cpu_bound_task, args=(1000000,))
-    p1.start()
-    p1.join()
-    print("  Process finished.")
+    with multiprocessing.Pool() as pool:
+        results = pool.map(cpu_bound_task, [1000000] * 4)
+    print(f"  Pool finished {len(results)} tasks: {results[0]} each.")
+    print(f"  Closed-form answer, no process needed: {cpu_bound_task_closed(1000000)}")
 
     # C. Asyncio (Asynchronous)
     print("C. Asyncio:")
+    # TaskGroup (Python 3.11+): every task created in the 'async with' block runs
+    # concurrently, and the block waits for all of them before exiting.
     async def run_async():
-        await asyncio.gather(
-            async_task("X", 1),
-            async_task("Y", 1)
-        )
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(async_task("X", 1))
+            tg.create_task(async_task("Y", 1))
     asyncio.run(run_async())
 
     # ==========================================
@@ -179,17 +229,6 @@ def main():
     # ==========================================
     print("\n--- 6. Slots ---")
     
-    class RegularPoint:
-        def __init__(self, x, y):
-            self.x = x
-            self.y = y
-
-    class SlottedPoint:
-        __slots__ = ['x', 'y'] # Fixed attributes, no __dict__
-        def __init__(self, x, y):
-            self.x = x
-            self.y = y
-
     reg = RegularPoint(1, 2)
     slot = SlottedPoint(1, 2)
     print(f"Regular has __dict__: {hasattr(reg, '__dict__')}")
@@ -30,6 +30,7 @@ Logging - The Security Camera:
 
 print() is like shouting "Hey!" in the hallway. It's ephemeral and annoying.
 Logging is a security camera recording. It timestamps exactly what happened ("Door opened at 10:00 PM"), how severe it was ("Warning: Window cracked"), and saves it to a tape (file) for review after a crash."""
+import io
 import logging
 import unittest
 
@@ -46,8 +47,18 @@ logging.basicConfig(
     datefmt='%H:%M:%S'
 )
 
+# Our format doesn't show thread/process info, so stop collecting it for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+; harmless on older versions
+
 logger = logging.getLogger(__name__)
 
+# Checked once here so hot code can skip debug logging with a plain 'if'.
+# Trade-off: if the log level is changed later at runtime, refresh this flag.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
 # ==========================================
 # 2. DOCUMENTATION & PEP 8 (The Manual & Building Code)
 # ==========================================
@@ -68,7 +79,9 @@ def complex_calculation(a: int, b: int) -> float:
     Raises:
         ValueError: If b is zero.
     """
-    logger.info(f"Starting calculation with a={a}, b={b}")
+    # Pass values as arguments instead of using an f-string: the logger only builds
+    # the message if the record is actually emitted (e.g. not when DEBUG is filtered out).
+    logger.info("Starting calculation with a=%s, b=%s", a, b)
     
     if b == 0:
         # Log the error before raising it, so we have a record
@@ -76,7 +89,8 @@ def complex_calculation(a: int, b: int) -> float:
         raise ValueError("Cannot divide by zero")
         
     result = a / b
-    logger.debug(f"Calculation result: {result}")
+    if _DEBUG:
+        logger.debug("Calculation result: %s", result)
     return result
 
 # ==========================================
@@ -105,20 +119,38 @@ def main():
     
     print("\n--- 2. Logging Demo ---")
     # Notice how the logs appear with timestamps
-    try:
-        val = complex_calculation(10, 2)
-        print(f"  (Print Output) Result: {val}")
-        
-        # This will trigger the error log
-        complex_calculation(10, 0)
-    except ValueError:
-        print("  (Print Output) Caught expected error.")
+    val = complex_calculation(10, 2)
+    print(f"  (Print Output) Result: {val}")
+
+    # complex_calculation still raises ValueError for b == 0 (its contract, see
+    # the tests below), but callers that expect zeros should check first:
+    # an 'if' is much cheaper than raising and catching an exception.
+    numerator, denominator = 10, 0
+    if denominator != 0:
+        complex_calculation(numerator, denominator)
+    else:
+        logger.warning("Skipping calculation: denominator is zero")
+        print("  (Print Output) Skipped division by zero.")
 
     print("\n--- 3. Running Tests ---")
     # Running unittest programmatically
-    # exit=False is crucial here, otherwise the script stops immediately!
-    # argv=['first-arg-is-ignored'] prevents unittest from trying to parse our script's CLI args
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    # The runner writes its report into an in-memory buffer (io.StringIO) instead of
+    # the console; buffer=True also holds back anything the tests print. We only
+    # show the full report if something failed.
+    # Log handlers write to the stream they were given at configuration time, not
+    # through sys.stdout/sys.stderr, so buffer=True can't hold them back. Logging
+    # is muted while the suite runs and turned back on afterwards.
+    report = io.StringIO()
+    runner = unittest.TextTestRunner(stream=report, verbosity=0, buffer=True)
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestCalculation)
+    logging.disable(logging.CRITICAL)
+    try:
+        result = runner.run(suite)
+    finally:
+        logging.disable(logging.NOTSET)
+    print(f"Tests run: {result.testsRun}, failures: {len(result.failures)}, errors: {len(result.errors)}")
+    if not result.wasSuccessful():
+        print(report.getvalue())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file